@@ -5,9 +5,9 @@ Ported from 3WiFi WPS PIN generator (https://3wifi.stascorp.com/wpspin)
 Original JavaScript implementation by Stas'M and contributors
 """
 
+import functools
 import sys
-import argparse
-from typing import List, Dict, Callable, Tuple
+from typing import List, Dict, Callable, Optional, Sequence, Tuple
 
 
 # Algorithm modes
@@ -16,31 +16,27 @@ ALGO_MACSN = 1
 ALGO_EMPTY = 2
 ALGO_STATIC = 3
 
+# Separator characters stripped from BSSID input
+_MAC_STRIP = str.maketrans('', '', ':-. ')
 
-def zero_fill(number: int, width: int) -> str:
-    """Pad number with leading zeros to specified width"""
-    s = str(number)
-    if len(s) < width:
-        return '0' * (width - len(s)) + s
-    return s
 
-
-def reverse(s: str) -> str:
-    """Reverse a string"""
-    return s[::-1]
+def _reverse_byte_bits(x: int) -> int:
+    """Reverse the bit order within each byte of a 48-bit value"""
+    x = ((x & 0x555555555555) << 1) | ((x >> 1) & 0x555555555555)
+    x = ((x & 0x333333333333) << 2) | ((x >> 2) & 0x333333333333)
+    return ((x & 0x0F0F0F0F0F0F) << 4) | ((x >> 4) & 0x0F0F0F0F0F0F)
 
 
 def pin_checksum(pin: int) -> int:
     """Calculate WPS PIN checksum"""
     pin = pin % 10000000
-    accum = 0
-    t = pin
-    
-    while t:
-        accum += 3 * (t % 10)
-        t //= 10
-        accum += t % 10
-        t //= 10
+    accum = (3 * (pin % 10 +
+                  pin // 100 % 10 +
+                  pin // 10000 % 10 +
+                  pin // 1000000) +
+             pin // 10 % 10 +
+             pin // 1000 % 10 +
+             pin // 100000 % 10)
     
     return (pin * 10) + ((10 - (accum % 10)) % 10)
 
@@ -49,36 +45,24 @@ def algo_dlink(mac: int) -> int:
     """D-Link PIN algorithm"""
     mac &= 0xFFFFFF
     mac ^= 0x55AA55
-    mac ^= (((mac & 0xF) << 4) |
-            ((mac & 0xF) << 8) |
-            ((mac & 0xF) << 12) |
-            ((mac & 0xF) << 16) |
-            ((mac & 0xF) << 20))
+    # Copy the low nibble into nibbles 1-5 (disjoint, so a multiply suffices)
+    mac ^= (mac & 0xF) * 0x111110
     mac %= 10000000
     if mac < 1000000:
         mac += ((mac % 9) * 1000000) + 1000000
     return mac
 
 
-def algo_dsl_mac_sn(mac: int, sn: str = '', init: Dict = None) -> int:
-    """
-    Universal DSL algorithm that derives PIN from MAC and S/N
-    Used by Belkin, DSL-EasyBox, Arcadyan, and others
-    Reverse-engineered by Stas'M
-    """
-    if init is None:
-        init = {}
-    
+def _sn_nibbles(sn: str) -> List[int]:
+    """Pad or truncate S/N to 4 chars and convert it to nibbles"""
     if not sn:
         sn = ''
     
-    # Pad or truncate S/N to 4 chars
     if len(sn) < 4:
         sn = sn.zfill(4)
     if len(sn) > 4:
         sn = sn[-4:]
     
-    # Convert S/N to nibbles
     sn_nibbles = []
     for c in sn:
         try:
@@ -86,118 +70,270 @@ def algo_dsl_mac_sn(mac: int, sn: str = '', init: Dict = None) -> int:
         except ValueError:
             x = 0
         sn_nibbles.append(x)
+    return sn_nibbles
+
+
+@functools.lru_cache(maxsize=64)
+def _make_dsl(bx: Tuple[int, ...], bk1: int = 60, bk2: int = 195, k1: int = 0,
+              k2: int = 0, pin: int = 0, xor: int = 0, sub: int = 0,
+              sk: int = 0, skv: int = 0) -> Callable:
+    """
+    Build the universal DSL algorithm for one fixed parameter set
     
-    # Extract NIC nibbles from MAC
-    nic = [
-        (mac & 0xFFFF) >> 12,
-        (mac & 0xFFF) >> 8,
-        (mac & 0xFF) >> 4,
-        mac & 0xF
+    The parameters become constants in generated source, so every bit loop
+    is unrolled into a plain sum or XOR of the selected nibbles. Results are
+    cached, so each parameter set is only compiled once.
+    """
+    if any(v < 0 or v > 0xFF for v in (bk1, bk2) + tuple(bx)):
+        raise ValueError('DSL bit masks must fit in 8 bits')
+    
+    def bits(value):
+        return [i for i in range(8) if value >> i & 1]
+    
+    # Nibble sources for k1/k2: NIC nibbles first, then S/N nibbles
+    k_src = ['n0', 'n1', 'n2', 'n3', 's0', 's1', 's2', 's3']
+    # Nibble sources for each PIN nibble, indexed by bit position
+    x_src = ['k1', 'k2', 'n1', 'n2', 'n3', 's1', 's2', 's3']
+    
+    lines = [
+        'def dsl(mac, sn=""):',
+        '    s0, s1, s2, s3 = _sn_nibbles(sn)',
+        '    n0 = (mac & 0xFFFF) >> 12',
+        '    n1 = (mac & 0xFFF) >> 8',
+        '    n2 = (mac & 0xFF) >> 4',
+        '    n3 = mac & 0xF',
+        '    k1 = (%s) & 0xF' % ' + '.join([str(k1 & 0xF)] + [k_src[i] for i in bits(bk1)]),
+        '    k2 = (%s) & 0xF' % ' + '.join([str(k2 & 0xF)] + [k_src[i] for i in bits(bk2)]),
     ]
     
-    # Default init values
-    bk1 = init.get('bk1', 60)
-    bk2 = init.get('bk2', 195)
-    k1_init = init.get('k1', 0)
-    k2_init = init.get('k2', 0)
-    pin_init = init.get('pin', 0)
-    xor_init = init.get('xor', 0)
-    sub_mode = init.get('sub', 0)
-    sk = init.get('sk', 0)
-    skv = init.get('skv', 0)
-    bx = init.get('bx', [])
-    
-    # Calculate k1
-    k1 = k1_init & 0xF
-    i = 0
-    while bk1:
-        if bk1 & 1:
-            k1 += nic[i] if i < 4 else sn_nibbles[i - 4]
-            k1 &= 0xF
-        bk1 >>= 1
-        i += 1
-    
-    # Calculate k2
-    k2 = k2_init & 0xF
-    i = 0
-    while bk2:
-        if bk2 & 1:
-            k2 += nic[i] if i < 4 else sn_nibbles[i - 4]
-            k2 &= 0xF
-        bk2 >>= 1
-        i += 1
-    
-    # Calculate PIN
-    pin = pin_init
-    for bx_val in bx:
-        xor = xor_init & 0xF
-        i = 0
-        bx_copy = bx_val
-        while bx_copy:
-            if bx_copy & 1:
-                if i > 4:
-                    xor ^= sn_nibbles[i - 4]
-                elif i > 1:
-                    xor ^= nic[i - 1]
-                elif i > 0:
-                    xor ^= k2
-                else:
-                    xor ^= k1
-            bx_copy >>= 1
-            i += 1
-        pin <<= 4
-        pin |= xor
-    
-    # Apply subtraction/addition mode
-    if sub_mode == 0:
-        return pin % 10000000
-    elif sub_mode == 1:
-        mult = k2 if sk > 1 else (k1 if sk > 0 else skv)
-        return (pin % 10000000) - ((pin // 10000000) * mult)
-    elif sub_mode == 2:
-        mult = k2 if sk > 1 else (k1 if sk > 0 else skv)
-        return (pin % 10000000) + ((pin // 10000000) * mult)
-    
-    return pin % 10000000
+    terms = [str(pin << (4 * len(bx)))]
+    for n, bx_val in enumerate(bx):
+        nibble = ' ^ '.join([str(xor & 0xF)] + [x_src[i] for i in bits(bx_val)])
+        terms.append('((%s) << %d)' % (nibble, 4 * (len(bx) - n - 1)))
+    lines.append('    pin = %s' % ' | '.join(terms))
+    
+    mult = 'k2' if sk > 1 else ('k1' if sk > 0 else str(skv))
+    if sub == 1:
+        lines.append('    return (pin %% 10000000) - ((pin // 10000000) * %s)' % mult)
+    elif sub == 2:
+        lines.append('    return (pin %% 10000000) + ((pin // 10000000) * %s)' % mult)
+    else:
+        lines.append('    return pin % 10000000')
+    
+    namespace = {'_sn_nibbles': _sn_nibbles}
+    exec('\n'.join(lines), namespace)
+    return namespace['dsl']
+
+
+# Parameter names accepted by algo_dsl_mac_sn and _make_dsl
+_DSL_PARAMS = frozenset(('bx', 'bk1', 'bk2', 'k1', 'k2', 'pin', 'xor', 'sub', 'sk', 'skv'))
+
+
+def algo_dsl_mac_sn(mac: int, sn: str = '', init: Dict = None, *,
+                    bx: Tuple[int, ...] = (), bk1: int = 60, bk2: int = 195,
+                    k1: int = 0, k2: int = 0, pin: int = 0, xor: int = 0,
+                    sub: int = 0, sk: int = 0, skv: int = 0) -> int:
+    """
+    Universal DSL algorithm that derives PIN from MAC and S/N
+    Used by Belkin, DSL-EasyBox, Arcadyan, and others
+    Reverse-engineered by Stas'M
+    
+    Parameters are passed as keyword arguments; the legacy init dict
+    (e.g. {'bx': [...]}) is still accepted but cannot be combined with them.
+    """
+    bx = tuple(bx)
+    if init is not None:
+        if (bx, bk1, bk2, k1, k2, pin, xor, sub, sk, skv) != ((), 60, 195, 0, 0, 0, 0, 0, 0, 0):
+            raise TypeError('algo_dsl_mac_sn() accepts either init or keyword parameters, not both')
+        params = {key: value for key, value in init.items() if key in _DSL_PARAMS}
+        return algo_dsl_mac_sn(mac, sn, **params)
+    
+    return _make_dsl(bx, bk1, bk2, k1, k2, pin, xor, sub, sk, skv)(mac, sn)
 
 
 def algo_asus(mac: int) -> int:
     """ASUS PIN algorithm"""
-    mac_str = zero_fill(hex(mac)[2:].upper(), 12)
+    b = ((mac >> 40) & 0xFF, (mac >> 32) & 0xFF, (mac >> 24) & 0xFF,
+         (mac >> 16) & 0xFF, (mac >> 8) & 0xFF, mac & 0xFF)
+    b5 = b[5]
+    total = b[1] + b[2] + b[3] + b[4] + b5
     
-    b = [int(mac_str[i:i+2], 16) for i in range(0, 12, 2)]
-    
-    pin = []
+    pin = 0
     for i in range(7):
-        pin.append((b[i % 6] + b[5]) % (10 - ((i + b[1] + b[2] + b[3] + b[4] + b[5]) % 7)))
+        pin = pin * 10 + (b[i % 6] + b5) % (10 - ((i + total) % 7))
     
-    return int(''.join(map(str, pin)))
+    return pin
 
 
 def algo_airocon(mac: int) -> int:
     """Airocon Realtek PIN algorithm"""
-    mac_str = zero_fill(hex(mac)[2:].upper(), 12)
-    
-    b = [int(mac_str[i:i+2], 16) for i in range(0, 12, 2)]
+    b0 = (mac >> 40) & 0xFF
+    b1 = (mac >> 32) & 0xFF
+    b2 = (mac >> 24) & 0xFF
+    b3 = (mac >> 16) & 0xFF
+    b4 = (mac >> 8) & 0xFF
+    b5 = mac & 0xFF
     
-    return (((b[0] + b[1]) % 10) +
-            (((b[5] + b[0]) % 10) * 10) +
-            (((b[4] + b[5]) % 10) * 100) +
-            (((b[3] + b[4]) % 10) * 1000) +
-            (((b[2] + b[3]) % 10) * 10000) +
-            (((b[1] + b[2]) % 10) * 100000) +
-            (((b[0] + b[1]) % 10) * 1000000))
+    return (((b0 + b1) % 10) * 1000001 +
+            (((b5 + b0) % 10) * 10) +
+            (((b4 + b5) % 10) * 100) +
+            (((b3 + b4) % 10) * 1000) +
+            (((b2 + b3) % 10) * 10000) +
+            (((b1 + b2) % 10) * 100000))
+
+
+# Simple MAC-derived PIN functions
+def _pin24(mac: int) -> int:
+    return mac & 0xFFFFFF
+
+
+def _pin28(mac: int) -> int:
+    return mac & 0xFFFFFFF
+
+
+def _pin32(mac: int) -> int:
+    return mac % 0x100000000
+
+
+def _pin36(mac: int) -> int:
+    return mac % 0x1000000000
+
+
+def _pin40(mac: int) -> int:
+    return mac % 0x10000000000
+
+
+def _pin44(mac: int) -> int:
+    return mac % 0x100000000000
+
+
+def _pin48(mac: int) -> int:
+    return mac
+
+
+# Reverse byte variants
+def _pin24rh(mac: int) -> int:
+    return ((mac & 0xFF) << 16) | (mac & 0xFF00) | ((mac >> 16) & 0xFF)
+
+
+def _pin32rh(mac: int) -> int:
+    return (((mac & 0xFF) << 24) | ((mac & 0xFF00) << 8) |
+            ((mac >> 8) & 0xFF00) | ((mac >> 24) & 0xFF))
+
+
+def _pin48rh(mac: int) -> int:
+    return int.from_bytes(mac.to_bytes(6, 'big'), 'little')
+
+
+# Reverse nibble variants
+def _pin24rn(mac: int) -> int:
+    # Swap nibbles within each byte, then reverse byte order
+    mac = ((mac & 0x0F0F0F) << 4) | ((mac >> 4) & 0x0F0F0F)
+    return ((mac & 0xFF) << 16) | (mac & 0xFF00) | ((mac >> 16) & 0xFF)
+
+
+def _pin32rn(mac: int) -> int:
+    mac = ((mac & 0x0F0F0F0F) << 4) | ((mac >> 4) & 0x0F0F0F0F)
+    return (((mac & 0xFF) << 24) | ((mac & 0xFF00) << 8) |
+            ((mac >> 8) & 0xFF00) | ((mac >> 24) & 0xFF))
+
+
+def _pin48rn(mac: int) -> int:
+    mac = ((mac & 0x0F0F0F0F0F0F) << 4) | ((mac >> 4) & 0x0F0F0F0F0F0F)
+    return int.from_bytes(mac.to_bytes(6, 'big'), 'little')
+
+
+# Reverse bits variants
+def _pin24rb(mac: int) -> int:
+    mac = _reverse_byte_bits(mac & 0xFFFFFF)
+    return ((mac & 0xFF) << 16) | (mac & 0xFF00) | ((mac >> 16) & 0xFF)
+
+
+def _pin32rb(mac: int) -> int:
+    mac = _reverse_byte_bits(mac & 0xFFFFFFFF)
+    return (((mac & 0xFF) << 24) | ((mac & 0xFF00) << 8) |
+            ((mac >> 8) & 0xFF00) | ((mac >> 24) & 0xFF))
+
+
+def _pin48rb(mac: int) -> int:
+    mac = _reverse_byte_bits(mac)
+    return int.from_bytes(mac.to_bytes(6, 'big'), 'little')
+
+
+def _pin_dlink1(mac: int) -> int:
+    return algo_dlink(mac + 1)
+
+
+# DSL algorithm variants, specialised once for their fixed parameters
+_dsl_belkin = _make_dsl((66, 129, 209, 10, 24, 3, 39))
+_dsl_arcadyan = _make_dsl((129, 65, 6, 10, 136, 80, 33))
+
+
+def _pin_easybox(mac: int, sn: str = '') -> int:
+    if not sn:
+        sn = str(mac & 0xFFFF)
+    return _dsl_arcadyan(mac, sn)
+
+
+def _pin_livebox(mac: int, sn: str = '') -> int:
+    return _dsl_arcadyan(mac - 2, sn)
+
+
+# NIC operations
+def _pin_inv_nic(mac: int) -> int:
+    return (~mac) & 0xFFFFFF
+
+
+def _pin_nic2(mac: int) -> int:
+    return (mac & 0xFFFFFF) * 2
+
+
+def _pin_nic3(mac: int) -> int:
+    return (mac & 0xFFFFFF) * 3
+
+
+# OUI operations
+def _oui_add_nic(mac: int) -> int:
+    oui = (mac >> 24) & 0xFFFFFF
+    nic = mac & 0xFFFFFF
+    return (oui + nic) % 0x1000000
+
+
+def _oui_sub_nic(mac: int) -> int:
+    # Subtraction modulo 2^24 covers both the nic < oui and wrap-around cases
+    return (((mac >> 24) & 0xFFFFFF) - (mac & 0xFFFFFF)) & 0xFFFFFF
+
+
+def _oui_xor_nic(mac: int) -> int:
+    return ((mac >> 24) & 0xFFFFFF) ^ (mac & 0xFFFFFF)
+
+
+def _pin_empty(mac: int) -> str:
+    return ''
 
 
 # Algorithm definitions
 class Algorithm:
-    def __init__(self, id: str, name: str, mode: int, func: Callable, prefixes: List[str] = None):
+    __slots__ = ('id', 'name', 'mode', 'func', 'prefixes', 'precomputed')
+
+    def __init__(self, id: str, name: str, mode: int, func: Callable, prefixes: Sequence[str] = None):
         self.id = id
         self.name = name
         self.mode = mode
         self.func = func
         self.prefixes = prefixes or []
+        # Static and empty PINs do not depend on the MAC, so format them once
+        self.precomputed: Optional[str] = None
+        if mode == ALGO_STATIC:
+            self.precomputed = f'{pin_checksum(func(0)):08d}'
+        elif mode == ALGO_EMPTY:
+            self.precomputed = ''
+
 
+# Broadcom 4, 5 and 6 share the same prefix list
+_PREFIXES_BRCM456 = ('14D64D', '18622C', '1C7EE5', '204E7F', '28107B', '4C17EB', '7C03D8',
+                     '84C9B2', 'B8A386', 'BCF685', 'C8BE19', 'C8D3A3', 'CCB255', 'D86CE9',
+                     'FC7516')
 
 # MAC prefix database (OUI) for each algorithm
 # Extracted from the HTML textareas
@@ -283,17 +419,11 @@ MAC_PREFIXES = {
 
     'pinBrcm3': ['14D64D', '1C7EE5', '28107B', '7C034C', 'B8A386', 'BCF685', 'C8BE19'],
 
-    'pinBrcm4': ['14D64D', '18622C', '1C7EE5', '204E7F', '28107B', '4C17EB', '7C03D8',
-                 '84C9B2', 'B8A386', 'BCF685', 'C8BE19', 'C8D3A3', 'CCB255', 'D86CE9',
-                 'FC7516'],
+    'pinBrcm4': _PREFIXES_BRCM456,
 
-    'pinBrcm5': ['14D64D', '18622C', '1C7EE5', '204E7F', '28107B', '4C17EB', '7C03D8',
-                 '84C9B2', 'B8A386', 'BCF685', 'C8BE19', 'C8D3A3', 'CCB255', 'D86CE9',
-                 'FC7516'],
+    'pinBrcm5': _PREFIXES_BRCM456,
 
-    'pinBrcm6': ['14D64D', '18622C', '1C7EE5', '204E7F', '28107B', '4C17EB', '7C03D8',
-                 '84C9B2', 'B8A386', 'BCF685', 'C8BE19', 'C8D3A3', 'CCB255', 'D86CE9',
-                 'FC7516'],
+    'pinBrcm6': _PREFIXES_BRCM456,
 
     'pinAirc1': ['181E78', '40F201', '44E9DD', 'D084B0'],
 
@@ -330,108 +460,33 @@ MAC_PREFIXES = {
 }
 
 
-def get_algorithms() -> List[Algorithm]:
-    """Return list of all algorithms with their implementations"""
+def _build_algorithms() -> List[Algorithm]:
+    """Build the list of all algorithms with their implementations"""
     algos = []
     
-    # 24-bit PIN
-    algos.append(Algorithm('pin24', '24-bit PIN', ALGO_MAC,
-                          lambda mac: mac & 0xFFFFFF,
-                          MAC_PREFIXES['pin24']))
-    
-    # 28-bit PIN  
-    algos.append(Algorithm('pin28', '28-bit PIN', ALGO_MAC,
-                          lambda mac: mac & 0xFFFFFFF,
-                          MAC_PREFIXES['pin28']))
-    
-    # 32-bit PIN
-    algos.append(Algorithm('pin32', '32-bit PIN', ALGO_MAC,
-                          lambda mac: mac % 0x100000000,
-                          MAC_PREFIXES['pin32']))
-    
-    # 36-bit PIN
-    algos.append(Algorithm('pin36', '36-bit PIN', ALGO_MAC,
-                          lambda mac: mac % 0x1000000000,
-                          MAC_PREFIXES['pin36']))
-    
-    # 40-bit PIN
-    algos.append(Algorithm('pin40', '40-bit PIN', ALGO_MAC,
-                          lambda mac: mac % 0x10000000000,
-                          MAC_PREFIXES['pin40']))
-    
-    # 44-bit PIN
-    algos.append(Algorithm('pin44', '44-bit PIN', ALGO_MAC,
-                          lambda mac: mac % 0x100000000000,
-                          MAC_PREFIXES['pin44']))
-    
-    # 48-bit PIN
-    algos.append(Algorithm('pin48', '48-bit PIN', ALGO_MAC,
-                          lambda mac: mac,
-                          MAC_PREFIXES['pin48']))
+    # N-bit PINs
+    algos.append(Algorithm('pin24', '24-bit PIN', ALGO_MAC, _pin24, MAC_PREFIXES['pin24']))
+    algos.append(Algorithm('pin28', '28-bit PIN', ALGO_MAC, _pin28, MAC_PREFIXES['pin28']))
+    algos.append(Algorithm('pin32', '32-bit PIN', ALGO_MAC, _pin32, MAC_PREFIXES['pin32']))
+    algos.append(Algorithm('pin36', '36-bit PIN', ALGO_MAC, _pin36, MAC_PREFIXES['pin36']))
+    algos.append(Algorithm('pin40', '40-bit PIN', ALGO_MAC, _pin40, MAC_PREFIXES['pin40']))
+    algos.append(Algorithm('pin44', '44-bit PIN', ALGO_MAC, _pin44, MAC_PREFIXES['pin44']))
+    algos.append(Algorithm('pin48', '48-bit PIN', ALGO_MAC, _pin48, MAC_PREFIXES['pin48']))
     
     # Reverse byte variants
-    def pin24rh(mac):
-        mac &= 0xFFFFFF
-        mac_str = zero_fill(hex(mac)[2:], 6)
-        return int(mac_str[4:6] + mac_str[2:4] + mac_str[0:2], 16)
-    
-    algos.append(Algorithm('pin24rh', 'Reverse byte 24-bit', ALGO_MAC, pin24rh, []))
-    
-    def pin32rh(mac):
-        mac %= 0x100000000
-        mac_str = zero_fill(hex(mac)[2:], 8)
-        return int(mac_str[6:8] + mac_str[4:6] + mac_str[2:4] + mac_str[0:2], 16)
-    
-    algos.append(Algorithm('pin32rh', 'Reverse byte 32-bit', ALGO_MAC, pin32rh, []))
-    
-    def pin48rh(mac):
-        mac_str = zero_fill(hex(mac)[2:], 12)
-        return int(mac_str[10:12] + mac_str[8:10] + mac_str[6:8] + 
-                  mac_str[4:6] + mac_str[2:4] + mac_str[0:2], 16)
-    
-    algos.append(Algorithm('pin48rh', 'Reverse byte 48-bit', ALGO_MAC, pin48rh, []))
+    algos.append(Algorithm('pin24rh', 'Reverse byte 24-bit', ALGO_MAC, _pin24rh, []))
+    algos.append(Algorithm('pin32rh', 'Reverse byte 32-bit', ALGO_MAC, _pin32rh, []))
+    algos.append(Algorithm('pin48rh', 'Reverse byte 48-bit', ALGO_MAC, _pin48rh, []))
     
     # Reverse nibble variants
-    def pin24rn(mac):
-        mac &= 0xFFFFFF
-        mac_str = zero_fill(hex(mac)[2:], 6)
-        return int(reverse(mac_str), 16)
-    
-    algos.append(Algorithm('pin24rn', 'Reverse nibble 24-bit', ALGO_MAC, pin24rn, []))
-    
-    def pin32rn(mac):
-        mac %= 0x100000000
-        mac_str = zero_fill(hex(mac)[2:], 8)
-        return int(reverse(mac_str), 16)
-    
-    algos.append(Algorithm('pin32rn', 'Reverse nibble 32-bit', ALGO_MAC, pin32rn, []))
-    
-    def pin48rn(mac):
-        mac_str = zero_fill(hex(mac)[2:], 12)
-        return int(reverse(mac_str), 16)
-    
-    algos.append(Algorithm('pin48rn', 'Reverse nibble 48-bit', ALGO_MAC, pin48rn, []))
+    algos.append(Algorithm('pin24rn', 'Reverse nibble 24-bit', ALGO_MAC, _pin24rn, []))
+    algos.append(Algorithm('pin32rn', 'Reverse nibble 32-bit', ALGO_MAC, _pin32rn, []))
+    algos.append(Algorithm('pin48rn', 'Reverse nibble 48-bit', ALGO_MAC, _pin48rn, []))
     
     # Reverse bits variants
-    def pin24rb(mac):
-        mac &= 0xFFFFFF
-        mac_str = bin(mac)[2:].zfill(24)
-        return int(reverse(mac_str), 2)
-    
-    algos.append(Algorithm('pin24rb', 'Reverse bits 24-bit', ALGO_MAC, pin24rb, []))
-    
-    def pin32rb(mac):
-        mac %= 0x100000000
-        mac_str = bin(mac)[2:].zfill(32)
-        return int(reverse(mac_str), 2)
-    
-    algos.append(Algorithm('pin32rb', 'Reverse bits 32-bit', ALGO_MAC, pin32rb, []))
-    
-    def pin48rb(mac):
-        mac_str = bin(mac)[2:].zfill(48)
-        return int(reverse(mac_str), 2)
-    
-    algos.append(Algorithm('pin48rb', 'Reverse bits 48-bit', ALGO_MAC, pin48rb, []))
+    algos.append(Algorithm('pin24rb', 'Reverse bits 24-bit', ALGO_MAC, _pin24rb, []))
+    algos.append(Algorithm('pin32rb', 'Reverse bits 32-bit', ALGO_MAC, _pin32rb, []))
+    algos.append(Algorithm('pin48rb', 'Reverse bits 48-bit', ALGO_MAC, _pin48rb, []))
     
     # D-Link algorithms
     algos.append(Algorithm('pinDLink', 'D-Link PIN', ALGO_MAC,
@@ -439,27 +494,22 @@ def get_algorithms() -> List[Algorithm]:
                           MAC_PREFIXES['pinDLink']))
     
     algos.append(Algorithm('pinDLink1', 'D-Link PIN +1', ALGO_MAC,
-                          lambda mac: algo_dlink(mac + 1),
+                          _pin_dlink1,
                           MAC_PREFIXES['pinDLink1']))
     
     # Belkin algorithm
     algos.append(Algorithm('pinBelkin', 'Belkin PIN', ALGO_MACSN,
-                          lambda mac, sn='': algo_dsl_mac_sn(mac, sn, {'bx': [66, 129, 209, 10, 24, 3, 39]}),
+                          _dsl_belkin,
                           MAC_PREFIXES['pinBelkin']))
     
     # EasyBox algorithm
-    def easybox_pin(mac, sn=''):
-        if not sn:
-            sn = str(mac & 0xFFFF)
-        return algo_dsl_mac_sn(mac, sn, {'bx': [129, 65, 6, 10, 136, 80, 33]})
-    
     algos.append(Algorithm('pinEasyBox', 'Vodafone EasyBox', ALGO_MACSN,
-                          easybox_pin,
+                          _pin_easybox,
                           MAC_PREFIXES['pinEasyBox']))
     
     # Livebox algorithm
     algos.append(Algorithm('pinLivebox', 'Livebox Arcadyan', ALGO_MACSN,
-                          lambda mac, sn='': algo_dsl_mac_sn(mac - 2, sn, {'bx': [129, 65, 6, 10, 136, 80, 33]}),
+                          _pin_livebox,
                           MAC_PREFIXES['pinLivebox']))
     
     # ASUS algorithm
@@ -472,51 +522,19 @@ def get_algorithms() -> List[Algorithm]:
                           algo_airocon,
                           MAC_PREFIXES['pinAirocon']))
     
-    # Inv NIC
-    algos.append(Algorithm('pinInvNIC', 'Inv NIC to PIN', ALGO_MAC,
-                          lambda mac: (~mac) & 0xFFFFFF,
-                          []))
-    
-    # NIC multipliers
-    algos.append(Algorithm('pinNIC2', 'NIC * 2', ALGO_MAC,
-                          lambda mac: (mac & 0xFFFFFF) * 2,
-                          []))
-    
-    algos.append(Algorithm('pinNIC3', 'NIC * 3', ALGO_MAC,
-                          lambda mac: (mac & 0xFFFFFF) * 3,
-                          []))
+    # NIC operations
+    algos.append(Algorithm('pinInvNIC', 'Inv NIC to PIN', ALGO_MAC, _pin_inv_nic, []))
+    algos.append(Algorithm('pinNIC2', 'NIC * 2', ALGO_MAC, _pin_nic2, []))
+    algos.append(Algorithm('pinNIC3', 'NIC * 3', ALGO_MAC, _pin_nic3, []))
     
     # OUI operations
-    def oui_add_nic(mac):
-        mac_str = zero_fill(hex(mac)[2:], 12)
-        oui = int(mac_str[0:6], 16)
-        nic = int(mac_str[6:12], 16)
-        return (oui + nic) % 0x1000000
-    
-    algos.append(Algorithm('pinOUIaddNIC', 'OUI + NIC', ALGO_MAC, oui_add_nic, []))
-    
-    def oui_sub_nic(mac):
-        mac_str = zero_fill(hex(mac)[2:], 12)
-        oui = int(mac_str[0:6], 16)
-        nic = int(mac_str[6:12], 16)
-        if nic < oui:
-            return oui - nic
-        else:
-            return (oui + 0x1000000 - nic) & 0xFFFFFF
-    
-    algos.append(Algorithm('pinOUIsubNIC', 'OUI - NIC', ALGO_MAC, oui_sub_nic, []))
-    
-    def oui_xor_nic(mac):
-        mac_str = zero_fill(hex(mac)[2:], 12)
-        oui = int(mac_str[0:6], 16)
-        nic = int(mac_str[6:12], 16)
-        return oui ^ nic
-    
-    algos.append(Algorithm('pinOUIxorNIC', 'OUI ^ NIC', ALGO_MAC, oui_xor_nic, []))
+    algos.append(Algorithm('pinOUIaddNIC', 'OUI + NIC', ALGO_MAC, _oui_add_nic, []))
+    algos.append(Algorithm('pinOUIsubNIC', 'OUI - NIC', ALGO_MAC, _oui_sub_nic, []))
+    algos.append(Algorithm('pinOUIxorNIC', 'OUI ^ NIC', ALGO_MAC, _oui_xor_nic, []))
     
     # Empty PIN
     algos.append(Algorithm('pinEmpty', 'Empty PIN', ALGO_EMPTY,
-                          lambda mac: '',
+                          _pin_empty,
                           MAC_PREFIXES['pinEmpty']))
     
     # Static PINs
@@ -611,19 +629,69 @@ def get_algorithms() -> List[Algorithm]:
     return algos
 
 
+# Algorithms are immutable, so build them once at import time
+_ALGOS: Tuple[Algorithm, ...] = tuple(_build_algorithms())
+
+
+def get_algorithms() -> List[Algorithm]:
+    """Return list of all algorithms with their implementations"""
+    return list(_ALGOS)
+
+
+def _algo_label(algo: Algorithm) -> str:
+    """Return the display name used in suggestion results"""
+    if algo.mode == ALGO_STATIC:
+        return f'Static PIN - {algo.name}'
+    return algo.name
+
+
+# Per-field views of _ALGOS, so the lookup path only touches what it needs
+_ALGO_FUNCS: Tuple[Callable, ...] = tuple(algo.func for algo in _ALGOS)
+_ALGO_MODES: Tuple[int, ...] = tuple(algo.mode for algo in _ALGOS)
+_ALGO_PRECOMPUTED: Tuple[Optional[str], ...] = tuple(algo.precomputed for algo in _ALGOS)
+_ALGO_LABELS: Tuple[str, ...] = tuple(_algo_label(algo) for algo in _ALGOS)
+
+
+def _build_prefix_index() -> Dict[int, Dict[str, List[int]]]:
+    """Bucket MAC prefixes by length, mapping each prefix to algorithm indices"""
+    # Algorithms with identical prefix lists are indexed in a single pass
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    for i, algo in enumerate(_ALGOS):
+        groups.setdefault(tuple(algo.prefixes), []).append(i)
+    
+    index: Dict[int, Dict[str, List[int]]] = {}
+    for prefixes, indices in groups.items():
+        for prefix in prefixes:
+            bucket = index.setdefault(len(prefix), {})
+            bucket.setdefault(prefix, []).extend(indices)
+    return index
+
+
+# Prefix length -> {prefix: [algorithm index, ...]}
+_PREFIX_BY_LEN = _build_prefix_index()
+
+
 def gen_pin(mac: int, sn: str, algo: Algorithm) -> str:
     """Generate PIN using specified algorithm"""
-    if algo.mode == ALGO_MACSN:
-        result = algo.func(mac, sn)
+    if algo.precomputed is not None:
+        return algo.precomputed
+    
+    return _compute_pin(algo.func, algo.mode, mac, sn)
+
+
+def _compute_pin(func: Callable, mode: int, mac: int, sn: str) -> str:
+    """Run an algorithm function and turn its result into a PIN string"""
+    if mode == ALGO_MACSN:
+        result = func(mac, sn)
     else:
-        result = algo.func(mac)
+        result = func(mac)
     
     if isinstance(result, str):
         return result
     
     # Apply checksum and format
     result = pin_checksum(result)
-    return zero_fill(str(result), 8)
+    return f'{result:08d}'
 
 
 def pin_suggest(bssid: str, sn: str = '', get_all: bool = False) -> List[Tuple[str, str]]:
@@ -639,7 +707,7 @@ def pin_suggest(bssid: str, sn: str = '', get_all: bool = False) -> List[Tuple[s
         List of (pin, algorithm_name) tuples
     """
     # Clean and parse MAC address
-    mac_clean = bssid.replace(':', '').replace('-', '').replace('.', '').replace(' ', '').upper()
+    mac_clean = bssid.translate(_MAC_STRIP).upper()
     
     try:
         mac = int(mac_clean, 16)
@@ -649,37 +717,37 @@ def pin_suggest(bssid: str, sn: str = '', get_all: bool = False) -> List[Tuple[s
     if mac > 0xFFFFFFFFFFFF:
         return []
     
+    if get_all:
+        indices = range(len(_ALGOS))
+    else:
+        # Look up each known prefix length; a MAC may hit several lengths
+        matched = set()
+        for length, bucket in _PREFIX_BY_LEN.items():
+            hits = bucket.get(mac_clean[:length])
+            if hits:
+                matched.update(hits)
+        indices = sorted(matched)
+    
     results = []
-    algos = get_algorithms()
-    
-    for algo in algos:
-        match = get_all
-        
-        if not get_all and algo.prefixes:
-            # Check if MAC matches any prefix for this algorithm
-            for prefix in algo.prefixes:
-                if mac_clean.startswith(prefix):
-                    match = True
-                    break
-        
-        if match:
-            pin = gen_pin(mac, sn, algo)
-            
-            if algo.mode == ALGO_STATIC:
-                results.append((pin, f'Static PIN - {algo.name}'))
-            else:
-                results.append((pin, algo.name))
+    
+    for i in indices:
+        pin = _ALGO_PRECOMPUTED[i]
+        if pin is None:
+            pin = _compute_pin(_ALGO_FUNCS[i], _ALGO_MODES[i], mac, sn)
+        results.append((pin, _ALGO_LABELS[i]))
     
     return results
 
 
 def format_mac(mac: int) -> str:
     """Format MAC address as XX:XX:XX:XX:XX:XX"""
-    mac_str = zero_fill(hex(mac)[2:].upper(), 12)
-    return ':'.join(mac_str[i:i+2] for i in range(0, 12, 2))
+    return ':'.join(f'{b:02X}' for b in mac.to_bytes(6, 'big'))
 
 
 def main():
+    # Imported here so library users of pin_suggest don't pay for argparse
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='WPS PIN Generator - Generate WPS PINs from BSSID/MAC address',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -704,7 +772,7 @@ Examples:
         return 1
     
     # Parse MAC for display
-    mac_clean = args.bssid.replace(':', '').replace('-', '').replace('.', '').replace(' ', '').upper()
+    mac_clean = args.bssid.translate(_MAC_STRIP).upper()
     mac_int = int(mac_clean, 16)
     mac_formatted = format_mac(mac_int)
     